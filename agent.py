@@ -8,10 +8,10 @@ class Agent:
     ALIVE = enum.auto()
     DEAD = enum.auto()
 
-    def __init__(self) -> None:
+    def __init__(self, width: int = 4, height: int = 4) -> None:
         self.__status = self.ALIVE
         self.__pos = (1, 1)
-        self.__knowledge = kb.KnowledgeBase()
+        self.__knowledge = kb.KnowledgeBase(width, height)
         self.__visited = [self.__pos]
         self.__gold = False
 
@@ -31,6 +31,11 @@ class Agent:
     def current_position(self) -> tuple[int, int]:
         return self.__pos
 
+    @property
+    def visited(self) -> list:
+        """Cuartos visitados por el agente, en orden"""
+        return self.__visited
+
     def has_gold(self) -> bool:
         return self.__gold
 
@@ -66,6 +71,13 @@ class Agent:
             self.__knowledge.tell(self.__pos, w.is_breezy(self.__pos), self.__knowledge.BREEZE)
             self.__knowledge.tell_safe(self.__pos)
 
+    def known_safe(self, rooms: list) -> list:
+        """Indica, para cada cuarto, si la base de conocimientos lo sabe seguro
+
+        Los cuartos visitados (en los que sobrevivió) siempre se saben seguros.
+        """
+        return self.__knowledge.ask_many(rooms, self.__knowledge.SAFE)
+
     def get_perceptions(self):
         """Recupera las percepciones e inferencias encontradas por cuarto"""
         return self.__knowledge.get_perceptions()
@@ -75,11 +87,19 @@ class Agent:
         print(f"Estado: {self.__status}, {'sin oro' if not self.__gold else 'con oro'}.")
         self.__knowledge.show()
 
+    def ask_suggestions(self) -> tuple[list, list, list]:
+        """Entrega los vecinos seguros, con posible pozo y con posible wumpus
+
+        Si el agente está muerto, las tres listas quedan vacías.
+        """
+        if self.alive:
+            return self.__knowledge.ask_suggestions(self.__pos, self.__visited)
+        return [], [], []
+
     def move_suggestions(self):
         """Consulta con la base de conocimientos qué posibilidades tiene"""
         if self.alive:
-            guesses = self.__knowledge.ask_suggestions(self.__pos,
-                                                       self.__visited)
+            guesses = self.ask_suggestions()
             suggestions = "Seguros: {}; posible pozo: {}; posible bicho: {}".format(*guesses)
         else:
             suggestions = "No suggestions for dead men"
@@ -93,14 +113,17 @@ class Agent:
         return False
 
 
-if __name__ == "__main__":
-    # Crea el mundo
-    w = world.WumpusWorld()
-    w.populate()
-    print(w)
+def play(w: world.WumpusWorld, player: Agent):
+    """Juega interactivamente en la terminal, moviendo al agente con WASD
 
-    # Crea el agente y percibe su posición inicial
-    player = Agent()
+    Parámetros
+    ----------
+    w: world.WumpusWorld
+        Mundo ya poblado
+    player: Agent
+        Agente, en su posición inicial
+    """
+    # Percibe la posición inicial
     player.perceive(w)
 
     # Mientras siga vivo y no haya trepado
@@ -135,3 +158,12 @@ if __name__ == "__main__":
         print("RIP in peace.")
     elif player.has_gold():
         print("Se ha robado el oro de la cueva.")
+
+
+if __name__ == "__main__":
+    # Crea el mundo
+    w = world.WumpusWorld()
+    w.populate()
+    print(w)
+
+    play(w, Agent())
@@ -0,0 +1,284 @@
+"""Comparación diferencial entre bases de conocimiento
+
+Reproduce recorridos aleatorios (con semilla) de un explorador en mundos aleatorios,
+usando al mismo tiempo la base de referencia (`oracle.ReferenceKnowledgeBase`) y una
+implementación candidata. Después de cada movimiento compara `get_perceptions` y
+`ask_suggestions` de ambas; si difieren, reduce el recorrido hasta uno mínimo que siga
+mostrando la diferencia.
+
+Uso:
+
+    python harness.py kb:KnowledgeBase --traces 5000 --seed 0
+"""
+import oracle
+import utils
+import world
+
+import argparse
+import importlib
+import random
+import sys
+import time
+
+# Movimientos posibles, con la misma convención que `agent.py` (WASD)
+MOVES = {
+    "w": (0, 1),
+    "s": (0, -1),
+    "a": (-1, 0),
+    "d": (1, 0),
+}
+
+
+class Explorer:
+    """Explorador mínimo que usa una base de conocimiento igual que `agent.Agent`
+
+    Hace las mismas llamadas que `Agent`: en cada cuarto, `tell` para el hedor y la briza
+    y `tell_safe`, y después de moverse, `update_safety` y `update_kb`. No depende de
+    `kb.KnowledgeBase`, para poder usar cualquier implementación.
+
+    Con `batch` mayor que 0, en cambio, junta las observaciones de `batch` movimientos
+    (incluyendo cuartos repetidos) y solo entonces las entrega y actualiza la base una
+    vez. Si además `tell_many` es verdadero, las entrega en una sola llamada a `tell_many`
+    en lugar de llamar a `tell` y `tell_safe` por cada una.
+    """
+    def __init__(self, engine, w: world.WumpusWorld, batch: int = 0,
+                 tell_many: bool = False) -> None:
+        self.engine = engine
+        self.environment = w
+        self.batch = batch
+        self.tell_many = tell_many
+        self.pending = []
+        self.moves = 0
+        self.pos = (1, 1)
+        self.visited = [self.pos]
+        self.alive = True
+        self.gold = False
+        # La percepción inicial se entrega sin actualizar la base, como en `agent.play`
+        self.perceive()
+        self.flush(update=False)
+
+    def perceive(self):
+        """Percibe el cuarto actual, como `Agent.perceive`, y deja pendiente la observación"""
+        w = self.environment
+        if w.is_wumpus(self.pos) or w.is_pit(self.pos):
+            self.alive = False
+            return
+        if w.is_shiny(self.pos):
+            self.gold = True
+        self.pending.append((self.pos, w.is_smelly(self.pos), w.is_breezy(self.pos)))
+
+    def flush(self, update: bool = True):
+        """Entrega a la base las observaciones pendientes y, si `update`, la actualiza"""
+        visited = self.visited if update else None
+        if self.tell_many:
+            self.engine.tell_many(self.pending, visited)
+        else:
+            for location, smelly, breezy in self.pending:
+                self.engine.tell(location, smelly, self.engine.SMELL)
+                self.engine.tell(location, breezy, self.engine.BREEZE)
+                self.engine.tell_safe(location)
+            if update:
+                self.engine.update_safety(self.visited)
+                self.engine.update_kb()
+        self.pending = []
+
+    def step(self, move: str):
+        """Aplica un movimiento (WASD); si choca con un borde, se queda en su lugar
+
+        Retorna
+        -------
+        bool:
+            Si se actualizó la base con este movimiento (si no, la observación quedó
+            pendiente hasta completar el lote)
+        """
+        dx, dy = MOVES[move]
+        x, y = self.pos[0] + dx, self.pos[1] + dy
+        if not (1 <= x <= self.environment.width and 1 <= y <= self.environment.height):
+            x, y = self.pos
+        self.pos = (x, y)
+        self.visited.append(self.pos)
+        self.moves += 1
+        self.perceive()
+        if self.finished or self.moves % max(self.batch, 1) == 0:
+            # Si muere, igual entrega lo que había percibido antes en el lote
+            if self.alive or self.pending:
+                self.flush()
+            return True
+        return False
+
+    @property
+    def finished(self) -> bool:
+        """El recorrido termina si muere o si vuelve al origen con el oro"""
+        return not self.alive or (self.gold and self.pos == (1, 1))
+
+    def snapshot(self) -> tuple:
+        """Lo que se compara entre las bases después de cada actualización
+
+        Incluye la respuesta de `ask` para el hedor, la briza y la seguridad de todos los
+        cuartos; con `tell_many`, se obtiene en cambio con `ask_many`.
+        """
+        rooms = list(self.environment.rooms)
+        asks = []
+        for dtype in (self.engine.SMELL, self.engine.BREEZE, self.engine.SAFE):
+            if self.tell_many:
+                asks.append(self.engine.ask_many(rooms, dtype))
+            else:
+                asks.append([self.engine.ask(room, dtype) for room in rooms])
+        perceptions = list(self.engine.get_perceptions())
+        if not self.alive:
+            return perceptions, None, asks
+        return perceptions, self.engine.ask_suggestions(self.pos, self.visited), asks
+
+
+def make_world(seed: int, width: int, height: int) -> world.WumpusWorld:
+    """Crea un mundo aleatorio reproducible a partir de una semilla"""
+    w = world.WumpusWorld(width, height)
+    w.populate_random(random.Random(seed))
+    return w
+
+
+def random_trace(rng: random.Random, length: int) -> str:
+    """Genera un recorrido aleatorio de `length` movimientos"""
+    return "".join(rng.choice("wasd") for _ in range(length))
+
+
+def compare(candidate, seed: int, trace: str, width: int, height: int, batch: int = 0):
+    """Reproduce un recorrido con ambas bases y busca la primera diferencia
+
+    Con `batch` mayor que 0, ambas bases reciben las observaciones en lotes de `batch`
+    movimientos: la referencia, con `tell` y `tell_safe` por cada una, y la candidata, con
+    `tell_many` (y se le pregunta con `ask_many`). Solo se comparan después de cada lote.
+
+    Retorna
+    -------
+    tuple or None:
+        `None` si no hay diferencias; si no, una tupla (índice del movimiento, lo que
+        entrega la referencia, lo que entrega la candidata). El índice -1 corresponde a la
+        percepción inicial, antes de moverse.
+    """
+    w_reference = make_world(seed, width, height)
+    w_candidate = make_world(seed, width, height)
+    reference = Explorer(oracle.ReferenceKnowledgeBase(width, height), w_reference, batch)
+    try:
+        tested = Explorer(candidate(width, height), w_candidate, batch, batch > 0)
+    except Exception as e:
+        return -1, reference.snapshot(), repr(e)
+
+    expected = reference.snapshot()
+    try:
+        got = tested.snapshot()
+    except Exception as e:
+        return -1, expected, repr(e)
+    if expected != got:
+        return -1, expected, got
+    for i, move in enumerate(trace):
+        if reference.finished:
+            break
+        updated = reference.step(move)
+        # Al final del recorrido se entrega lo que haya quedado pendiente
+        if not updated and i == len(trace) - 1:
+            reference.flush()
+            updated = True
+        try:
+            tested.step(move)
+            if not updated:
+                continue
+            if tested.pending:
+                tested.flush()
+            expected, got = reference.snapshot(), tested.snapshot()
+        except Exception as e:
+            return i, reference.snapshot(), repr(e)
+        if expected != got:
+            return i, expected, got
+    return None
+
+
+def shrink(candidate, seed: int, trace: str, width: int, height: int,
+           batch: int = 0) -> str:
+    """Reduce un recorrido que falla a uno mínimo que siga fallando
+
+    Primero lo corta en el primer movimiento con diferencias, y luego intenta borrar
+    trozos cada vez más pequeños (como en *delta debugging*), quedándose con el resultado
+    solo si sigue fallando. Como los movimientos contra un borde dejan al explorador en
+    su lugar, cualquier subsecuencia es un recorrido válido.
+    """
+    def fails(t):
+        return compare(candidate, seed, t, width, height, batch) is not None
+
+    index, _, _ = compare(candidate, seed, trace, width, height, batch)
+    trace = trace[:index + 1]
+    chunk = len(trace) // 2
+    while chunk > 0:
+        start = 0
+        while start < len(trace):
+            shorter = trace[:start] + trace[start + chunk:]
+            if fails(shorter):
+                trace = shorter
+            else:
+                start += chunk
+        chunk //= 2
+    return trace
+
+
+def load_engine(path: str):
+    """Importa una clase a partir de un texto `modulo:Clase`"""
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name or "KnowledgeBase")
+
+
+def run(candidate, traces: int, seed: int, width: int, height: int, length: int,
+        batch: int = 0) -> int:
+    """Compara la candidata con la referencia en `traces` recorridos aleatorios
+
+    Retorna
+    -------
+    int:
+        0 si no hubo diferencias, 1 en caso contrario (para usar como código de salida)
+    """
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for n in range(traces):
+        world_seed = rng.randrange(2**32)
+        trace = random_trace(rng, length)
+        if compare(candidate, world_seed, trace, width, height, batch) is None:
+            continue
+
+        # Encontró una diferencia: la reduce y la muestra
+        trace = shrink(candidate, world_seed, trace, width, height, batch)
+        index, expected, got = compare(candidate, world_seed, trace, width, height, batch)
+        print(f"Diferencia en el recorrido {n}: semilla del mundo {world_seed},"
+              f" movimientos {trace!r} (falla en el movimiento {index})")
+        print(make_world(world_seed, width, height))
+        print("Referencia:", expected)
+        print("Candidata: ", got)
+        return 1
+
+    elapsed = time.perf_counter() - start
+    print(f"{traces} recorridos sin diferencias en {elapsed:.2f} s"
+          f" ({traces / elapsed * 60:.0f} recorridos por minuto)")
+    return 0
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("candidate", nargs="?", default="kb:KnowledgeBase",
+                        help="base de conocimiento a probar, como modulo:Clase"
+                             " (default: kb:KnowledgeBase)")
+    parser.add_argument("--traces", type=utils.positive_int, default=1000, help="cantidad de recorridos")
+    parser.add_argument("--seed", type=int, default=0, help="semilla inicial")
+    parser.add_argument("--size", type=utils.positive_int, default=4, help="ancho y alto del mundo")
+    parser.add_argument("--length", type=utils.positive_int, default=40, help="movimientos por recorrido")
+    parser.add_argument("--batched", nargs="?", type=utils.positive_int, const=8, default=0,
+                        metavar="K",
+                        help="entrega las observaciones de K movimientos (default: 8) a la"
+                             " candidata en una sola llamada a tell_many")
+    args = parser.parse_args(argv)
+
+    return run(load_engine(args.candidate), args.traces, args.seed,
+               args.size, args.size, args.length, args.batched)
+
+
+__all__ = ["Explorer", "compare", "shrink", "run"]
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,9 +10,9 @@ class KnowledgeBase:
     BREEZE = enum.auto()
     SAFE = enum.auto()
 
-    def __init__(self) -> None:
+    def __init__(self, width: int = 4, height: int = 4) -> None:
         # Salas
-        self.__rooms = utils.generate_moves_between_cells()
+        self.__rooms = utils.generate_moves_between_cells(width, height)
 
         # Lo que se sabe hasta ahora
         self.__smell = []
@@ -56,6 +56,48 @@ class KnowledgeBase:
         if location not in self.__safe:
             self.__safe.append(location)
 
+    @staticmethod
+    def __insert_many(facts: list, locations: list):
+        """Agrega a `facts` las posiciones que aún no estén, respetando el orden"""
+        if not locations:
+            return
+        known = set(facts)
+        for location in locations:
+            if location not in known:
+                known.add(location)
+                facts.append(location)
+
+    def tell_many(self, observations: list, visited: list = None):
+        """Entrega varias observaciones a la base de una vez
+
+        Equivale a llamar `tell` para el hedor y la briza, y `tell_safe`, por cada
+        observación, pero elimina las repetidas y revisa cada lista de hechos una sola vez.
+        Conviene para lotes grandes; para una sola observación, `tell` es más barato.
+        Si se entregan los cuartos visitados, actualiza además la base (`update_safety` y
+        `update_kb`) una sola vez para todo el lote.
+
+        Parámetros
+        ----------
+        observations : list
+            Lista de tuplas (posición, tiene hedor, tiene briza) de cuartos visitados
+        visited : list
+            Cuartos visitados hasta ahora (opcional)
+        """
+        observations = list(dict.fromkeys(observations))
+        locations = [location for location, _, _ in observations]
+
+        self.__insert_many(self.__smell, [loc for loc, smelly, _ in observations if smelly])
+        self.__insert_many(self.__not_smell,
+                           [loc for loc, smelly, _ in observations if not smelly])
+        self.__insert_many(self.__breeze, [loc for loc, _, breezy in observations if breezy])
+        self.__insert_many(self.__not_breeze,
+                           [loc for loc, _, breezy in observations if not breezy])
+        self.__insert_many(self.__safe, locations)
+
+        if visited is not None:
+            self.update_safety(visited)
+            self.update_kb()
+
     def ask(self, location: tuple[int, int], dtype: str) -> bool:
         """Implementa el predicado `dtype(location)`
 
@@ -66,6 +108,18 @@ class KnowledgeBase:
             return True
         return False
 
+    def ask_many(self, locations: list, dtype: str) -> list:
+        """Implementa el predicado `dtype` para varias posiciones a la vez
+
+        Retorna
+        -------
+        list:
+            Lista de booleanos, uno por cada posición, en el mismo orden
+        """
+        knowledge, _ = self.__get_knowledge_type(dtype)
+        known = set(knowledge)
+        return [location in known for location in locations]
+
     def ask_if_safe(self, location: tuple[int, int], is_visited: bool) -> bool:
         # La casilla es segura si se cumple una de las opciones:
         # 1) no tiene ni olor ni briza
@@ -112,7 +166,7 @@ class KnowledgeBase:
         while changed:
             changed = False
             for room in visited:
-                neighbors = [n for n in utils.get_neighbors(room) if n not in self.__safe]
+                neighbors = [n for n in self.__rooms[room] if n not in self.__safe]
                 for n in neighbors:
                     if self.ask_if_safe(n, n in visited):
                         self.__safe.append(n)
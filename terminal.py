@@ -0,0 +1,140 @@
+"""Representación del mundo de Wumpus en la terminal, con secuencias ANSI
+
+Alternativa liviana a `window.py`: no necesita pygame ni pantalla, así que sirve por SSH
+o para mirar simulaciones sin gastar casi nada de CPU.
+"""
+import agent
+import utils
+import world
+
+import shutil
+import sys
+
+# Secuencias de escape ANSI
+ESC = "\033["
+CLEAR = ESC + "2J"
+HIDE_CURSOR = ESC + "?25l"
+SHOW_CURSOR = ESC + "?25h"
+RESET = ESC + "0m"
+REVERSE = ESC + "7m"
+DIM = ESC + "2m"
+
+
+def move_to(row: int, col: int) -> str:
+    """Secuencia para mover el cursor a una posición (ambas parten desde 1)"""
+    return f"{ESC}{row};{col}H"
+
+
+class TerminalRenderer:
+    """Dibuja el mundo y lo que sabe el agente en la terminal
+
+    Cada casilla muestra lo que hay realmente en el cuarto ("W", "P" o "G", si `reveal`
+    es verdadero) seguido de lo que percibe o deduce el agente ("S", "B", "P?", "W?").
+    La casilla del agente se muestra en video inverso, y las de cuartos de los que el
+    agente no sabe nada (ni los ha visitado, ni los sabe seguros, ni tiene percepciones o
+    sospechas sobre ellos), atenuadas.
+
+    Solo se reescriben las casillas que cambiaron desde el dibujo anterior, moviendo el
+    cursor directamente a ellas, y solo se muestra la parte del mundo que cabe en la
+    terminal, siguiendo al agente.
+    """
+    CELL_WIDTH = 7
+
+    def __init__(self, w: world.WumpusWorld, a: agent.Agent, stream=None,
+                 reveal: bool = True) -> None:
+        self.environment = w
+        self.agent = a
+        self.stream = stream if stream is not None else sys.stdout
+        self.reveal = reveal
+
+        # Cantidad de casillas que caben en la terminal: cada una ocupa su ancho más un
+        # separador, y se dejan tres líneas abajo: una en blanco, la del estado y la última,
+        # donde queda el cursor al terminar. Así nada hace que la terminal se desplace
+        columns, lines = shutil.get_terminal_size()
+        self.VIEW_COLS = max(1, min(w.width, (columns - 1) // (self.CELL_WIDTH + 1)))
+        self.VIEW_ROWS = max(1, min(w.height, lines - 3))
+        # El estado se corta al ancho de la terminal, para que no pase a la línea siguiente
+        self.STATUS_WIDTH = max(1, columns - 1)
+
+        # Lo último que se dibujó en cada posición de la pantalla, para redibujar solo lo
+        # que cambie
+        self.drawn = {}
+        self.status = None
+        self.started = False
+
+    def start(self):
+        """Limpia la terminal y dibuja los separadores, que no cambian"""
+        out = [CLEAR, HIDE_CURSOR]
+        separators = "|" + (" " * self.CELL_WIDTH + "|") * self.VIEW_COLS
+        for row in range(self.VIEW_ROWS):
+            out.append(move_to(row + 1, 1) + separators)
+        self.stream.write("".join(out))
+        self.started = True
+
+    def close(self):
+        """Deja el cursor visible y bajo el tablero"""
+        if self.started:
+            self.stream.write(move_to(self.VIEW_ROWS + 3, 1) + SHOW_CURSOR)
+            self.stream.flush()
+
+    def cell_text(self, room: tuple[int, int], perceptions: dict) -> str:
+        """Texto de una casilla: lo que hay en el cuarto y lo que sabe el agente"""
+        w = self.environment
+        truth = ""
+        if self.reveal:
+            if w.is_wumpus(room):
+                truth = "W"
+            elif w.is_pit(room):
+                truth = "P"
+            elif w.is_shiny(room):
+                truth = "G"
+        label = perceptions.get(room, "").replace(",", "")
+        return f"{truth:1}{label}"[:self.CELL_WIDTH].ljust(self.CELL_WIDTH)
+
+    def render(self, status: str = ""):
+        """Dibuja el estado actual, escribiendo solo lo que cambió
+
+        Parámetros
+        ----------
+        status : str
+            Mensaje a mostrar bajo el tablero
+        """
+        if not self.started:
+            self.start()
+
+        w = self.environment
+        agent_x, agent_y = self.agent.current_position
+        # Las filas en la pantalla van de arriba hacia abajo, al revés que en el mundo
+        camera_x = utils.viewport_origin(agent_x - 1, self.VIEW_COLS, w.width)
+        camera_y = utils.viewport_origin(w.height - agent_y, self.VIEW_ROWS, w.height)
+        perceptions = dict(self.agent.get_perceptions())
+        rooms = [(camera_x + col + 1, w.height - (camera_y + row))
+                 for row in range(self.VIEW_ROWS) for col in range(self.VIEW_COLS)]
+        safe = self.agent.known_safe(rooms)
+
+        out = []
+        for i, room in enumerate(rooms):
+            row, col = divmod(i, self.VIEW_COLS)
+            text = self.cell_text(room, perceptions)
+            if room == self.agent.current_position:
+                style = REVERSE
+            elif room in perceptions or safe[i]:
+                style = ""
+            else:
+                style = DIM
+            if self.drawn.get((row, col)) != (text, style):
+                self.drawn[row, col] = text, style
+                out.append(move_to(row + 1, 2 + col * (self.CELL_WIDTH + 1))
+                           + style + text + RESET)
+
+        status = status[:self.STATUS_WIDTH]
+        if status != self.status:
+            self.status = status
+            out.append(move_to(self.VIEW_ROWS + 2, 1) + ESC + "2K" + status)
+
+        if out:
+            self.stream.write("".join(out))
+            self.stream.flush()
+
+
+__all__ = ["TerminalRenderer"]
@@ -1,3 +1,4 @@
+import argparse
 import itertools
 
 
@@ -18,10 +19,10 @@ def _possible_moves(pos: int, min_pos: int = 1, max_pos: int = 4) -> list:
     list:
         Lista de enteros con las posibles diferencias de movimiento (-1 a 1)
     """
-    if pos == 1:
+    if pos == min_pos:
         # En la posición mínima solo puede avanzar
         return [0, 1]
-    elif pos == 4:
+    elif pos == max_pos:
         # En la posición máxima solo puede retroceder
         return [-1, 0]
     else:
@@ -29,19 +30,19 @@ def _possible_moves(pos: int, min_pos: int = 1, max_pos: int = 4) -> list:
         return [-1, 0, 1]
 
 
-def get_neighbors(cell: tuple[int, int], min_pos: int = 1, max_pos: int = 4) -> list:
+def get_neighbors(cell: tuple[int, int], min_pos: int = 1, max_x: int = 4, max_y: int = 4) -> list:
     """Entrega las celdas vecinas
 
-    Asume un mapa cuadrado.
-
     Parámetros
     ----------
     cell : tuple[int, int]
         Posición de la celda
     min_pos: int
         Posición mínima posible de una celda
-    max_pos: int
-        Posición máxima posible de una celda
+    max_x: int
+        Posición máxima posible de una celda en el eje X (ancho del mapa)
+    max_y: int
+        Posición máxima posible de una celda en el eje Y (alto del mapa)
 
     Retorna
     -------
@@ -52,7 +53,7 @@ def get_neighbors(cell: tuple[int, int], min_pos: int = 1, max_pos: int = 4) ->
     directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
     for dx, dy in directions:
         newx, newy = cell[0] + dx, cell[1] + dy
-        if newx <= max_pos and newy <= max_pos and newx >= min_pos and newy >= min_pos:
+        if newx <= max_x and newy <= max_y and newx >= min_pos and newy >= min_pos:
             neighbors.append((newx, newy))
 
     return neighbors
@@ -76,9 +77,56 @@ def generate_moves_between_cells(width: int = 4, height: int = 4) -> dict:
     cells = {}
     for x, y in itertools.product(range(1, width + 1), range(1, height + 1)):
         # Listas con diferencias posibles de movimientos
-        cells[x, y] = get_neighbors((x, y))
+        cells[x, y] = get_neighbors((x, y), max_x=width, max_y=height)
 
     return cells
 
 
-__all__ = ["generate_moves_between_cells", "get_neighbors"]
+def viewport_origin(center: int, view_size: int, total_size: int) -> int:
+    """Calcula el inicio de una ventana de visualización (viewport) en un eje
+
+    La ventana intenta quedar centrada en `center`, pero se ajusta para no salirse de
+    los bordes del mapa. Todas las posiciones parten desde 0.
+
+    Parámetros
+    ----------
+    center: int
+        Posición que se quiere mantener a la vista (por ejemplo, la del agente)
+    view_size: int
+        Cantidad de celdas visibles en el eje
+    total_size: int
+        Cantidad total de celdas del mapa en el eje
+
+    Retorna
+    -------
+    int:
+        Índice de la primera celda visible
+    """
+    start = center - view_size // 2
+    return max(0, min(start, total_size - view_size))
+
+
+def positive_int(text: str) -> int:
+    """Tipo para argparse: un entero mayor que cero"""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} no es un entero")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"{value} debe ser mayor que cero")
+    return value
+
+
+def non_negative_float(text: str) -> float:
+    """Tipo para argparse: un número real mayor o igual a cero"""
+    try:
+        value = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} no es un número")
+    if not value >= 0:
+        raise argparse.ArgumentTypeError(f"{value} debe ser mayor o igual a cero")
+    return value
+
+
+__all__ = ["generate_moves_between_cells", "get_neighbors", "non_negative_float", "positive_int",
+           "viewport_origin"]
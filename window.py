@@ -1,6 +1,9 @@
 import pygame
 import world
 import agent
+import utils
+
+import itertools
 
 
 class WorldWindow:
@@ -22,31 +25,118 @@ class WorldWindow:
         self.WHITE = (255, 255, 255)
         self.BLACK = (0, 0, 0)
         self.GRAY = (200, 200, 200)
+        self.DARK_GRAY = (120, 120, 120)
+        self.YELLOW = (230, 200, 60)
+        self.RED = (200, 50, 50)
 
         # Dimensiones de la ventana
         self.WINDOW_WIDTH = 800
         self.WINDOW_HEIGHT = 600
+        self.GRID_HEIGHT = self.WINDOW_HEIGHT - 100
+        self.FPS = 60
 
         # Dimensiones de la grilla
         self.GRID_ROWS = self.environment.height
         self.GRID_COLS = self.environment.width
-        self.RECTANGLE_WIDTH = self.WINDOW_WIDTH // self.GRID_COLS
-        self.RECTANGLE_HEIGHT = (self.WINDOW_HEIGHT - 100) // self.GRID_ROWS
+        # Tamaño mínimo de una casilla: si el mundo es más grande que lo que cabe en la
+        # ventana, se muestra solo una parte (viewport) que sigue al agente
+        self.MIN_CELL_SIZE = 40
+        self.BASE_WIDTH = max(self.WINDOW_WIDTH // self.GRID_COLS, self.MIN_CELL_SIZE)
+        self.BASE_HEIGHT = max(self.GRID_HEIGHT // self.GRID_ROWS, self.MIN_CELL_SIZE)
+        # Niveles de zoom, como multiplicadores del tamaño base de las casillas. Al alejar
+        # la vista, las casillas pueden achicarse hasta `MIN_ZOOM_CELL_SIZE`, y si quedan
+        # más chicas que `LABEL_MIN_SIZE` ya no se les escriben las etiquetas
+        self.ZOOM_LEVELS = (1 / 8, 1 / 4, 1 / 2, 1, 2, 4)
+        self.MIN_ZOOM_CELL_SIZE = 5
+        self.LABEL_MIN_SIZE = 20
+        self.zoom = self.ZOOM_LEVELS.index(1)
 
         # Initializa la ventana
         self.screen = pygame.display.set_mode((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
         pygame.display.set_caption("Wumpus")
+        self.clock = pygame.time.Clock()
 
         # Crea una fuente para dibujar el texto
         self.font = pygame.font.Font(None, 24)
+        self.glyphs = self.build_glyph_atlas()
 
         # Posición del agente
         self.agent_x, self.agent_y = self.grid_to_window_coords(*self.agent.current_position)
         self.escaped = False
 
+        # Lo que sabe el agente de cada cuarto y el minimapa que lo resume. Solo se
+        # recalculan cuando el agente se mueve, no en cada cuadro
+        self.last_pos = None
+        self.perceptions = {}
+        self.minimap = None
+        # Cuartos visitados sin repetir, y cuántos movimientos de `agent.visited` ya se
+        # agregaron, para no recorrer la lista completa en cada movimiento
+        self.visited_rooms = set()
+        self.visited_count = 0
+
+        # Viewport: casillas visibles, primera casilla visible y fondo con la grilla
+        self.set_zoom(self.zoom)
+
         # Estado de la ventana
         self.running = False
 
+    def build_glyph_atlas(self) -> dict:
+        """Pre-renderiza todas las etiquetas que pueden aparecer en una casilla
+
+        Las etiquetas son combinaciones de "S", "B", "P?" y "W?" (en ese orden, igual que
+        en `KnowledgeBase.get_perceptions`), así que son pocas y se pueden dibujar una sola
+        vez, en negro y en blanco, en lugar de llamar a `font.render` en cada cuadro.
+
+        Retorna
+        -------
+        dict:
+            Diccionario cuyas claves son (texto, color) y sus valores, las superficies
+        """
+        labels = ["S", "B", "P?", "W?"]
+        glyphs = {}
+        for n in range(1, len(labels) + 1):
+            for combination in itertools.combinations(labels, n):
+                text = ",".join(combination)
+                for color in (self.BLACK, self.WHITE):
+                    glyphs[text, color] = self.font.render(text, True, color)
+        return glyphs
+
+    def set_zoom(self, zoom: int):
+        """Cambia el nivel de zoom y recalcula el viewport y su fondo
+
+        Parámetros
+        ----------
+        zoom : int
+            Índice en `ZOOM_LEVELS`
+        """
+        zoom = max(0, min(zoom, len(self.ZOOM_LEVELS) - 1))
+        if (zoom < self.zoom
+                and self.VIEW_COLS == self.GRID_COLS and self.VIEW_ROWS == self.GRID_ROWS):
+            # El mundo ya se ve completo: alejarse más solo achicaría las casillas
+            return
+        self.zoom = zoom
+        factor = self.ZOOM_LEVELS[self.zoom]
+        self.RECTANGLE_WIDTH = max(int(self.BASE_WIDTH * factor), self.MIN_ZOOM_CELL_SIZE)
+        self.RECTANGLE_HEIGHT = max(int(self.BASE_HEIGHT * factor), self.MIN_ZOOM_CELL_SIZE)
+        self.show_labels = min(self.RECTANGLE_WIDTH, self.RECTANGLE_HEIGHT) >= self.LABEL_MIN_SIZE
+
+        # Cantidad de casillas que caben en la ventana
+        self.VIEW_COLS = max(1, min(self.GRID_COLS, self.WINDOW_WIDTH // self.RECTANGLE_WIDTH))
+        self.VIEW_ROWS = max(1, min(self.GRID_ROWS, self.GRID_HEIGHT // self.RECTANGLE_HEIGHT))
+        self.update_camera()
+
+        # La grilla no cambia entre cuadros, así que se dibuja una vez sobre una superficie
+        # que luego se copia completa a la pantalla
+        self.background = pygame.Surface((self.WINDOW_WIDTH, self.GRID_HEIGHT))
+        self.background.fill(self.WHITE)
+        self.draw_grid(self.background)
+        self.build_minimap()
+
+    def update_camera(self):
+        """Mueve el viewport para que siga al agente, sin salirse del mapa"""
+        self.camera_x = utils.viewport_origin(self.agent_x, self.VIEW_COLS, self.GRID_COLS)
+        self.camera_y = utils.viewport_origin(self.agent_y, self.VIEW_ROWS, self.GRID_ROWS)
+
     def handle_events(self):
         """Verifica los eventos, como salida y teclas presionadas"""
         for event in pygame.event.get():
@@ -65,6 +155,12 @@ class WorldWindow:
                     self.agent_x -= 1
                 elif event.key == pygame.K_d and self.agent_x < self.GRID_COLS - 1:
                     self.agent_x += 1
+            if event.type == pygame.KEYDOWN:
+                # El zoom se puede cambiar siempre, incluso con el juego terminado
+                if event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    self.set_zoom(self.zoom + 1)
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    self.set_zoom(self.zoom - 1)
 
     def grid_to_window_coords(self, grid_x: int, grid_y: int) -> tuple[int, int]:
         """Transforma las coordenadas desde la de la grilla de Wumpus a la de esta ventana
@@ -89,13 +185,28 @@ class WorldWindow:
         grid_y = self.GRID_ROWS - window_y
         return grid_x, grid_y
 
-    def draw_grid(self):
-        """Dibuja la grilla del mundo de Wumpus en la parte superior de la ventana"""
+    def window_to_screen_coords(self, window_x: int, window_y: int) -> tuple[int, int]:
+        """Transforma las coordenadas de la grilla de la ventana a píxeles en la pantalla
+
+        Considera la posición del viewport, así que la casilla visible de más arriba a la
+        izquierda queda en (0, 0).
+        """
+        return ((window_x - self.camera_x) * self.RECTANGLE_WIDTH,
+                (window_y - self.camera_y) * self.RECTANGLE_HEIGHT)
+
+    def draw_grid(self, surface: pygame.Surface):
+        """Dibuja la grilla visible del mundo de Wumpus sobre una superficie
+
+        Parámetros
+        ----------
+        surface : pygame.Surface
+            Superficie sobre la cual dibujar (normalmente, el fondo guardado)
+        """
         # Dibuja los rectángulos de la grilla
-        for row in range(self.GRID_ROWS):
-            for col in range(self.GRID_COLS):
+        for row in range(self.VIEW_ROWS):
+            for col in range(self.VIEW_COLS):
                 pygame.draw.rect(
-                    self.screen,  # Dónde dibujar
+                    surface,  # Dónde dibujar
                     self.BLACK,  # Color del rectángulo
                     (col * self.RECTANGLE_WIDTH, row * self.RECTANGLE_HEIGHT,
                      self.RECTANGLE_WIDTH, self.RECTANGLE_HEIGHT),  # posición y dimensiones
@@ -114,7 +225,7 @@ class WorldWindow:
         """
         # El cuadro (frame) interior es un rectángulo gris
         pygame.draw.rect(self.screen, self.GRAY,
-                         (0, self.WINDOW_HEIGHT - 100, self.WINDOW_WIDTH, 100))
+                         (0, self.GRID_HEIGHT, self.WINDOW_WIDTH, 100))
 
         # Dibuja el texto en la parte inferior de la ventana
         # 1. Crea la superficie con el texto
@@ -143,6 +254,10 @@ class WorldWindow:
         """
         # Obtiene la posición de la celda en la ventana
         window_x, window_y = self.grid_to_window_coords(row, col)
+        # Si está fuera del viewport, no hay nada que dibujar
+        if not (self.camera_x <= window_x < self.camera_x + self.VIEW_COLS
+                and self.camera_y <= window_y < self.camera_y + self.VIEW_ROWS):
+            return
 
         # Verifica si está sobre el agente o no, para saber si escribe en negro (sobre
         # blanco, en el caso normal) o en blanco (sobre negro, color de la posición del
@@ -152,16 +267,51 @@ class WorldWindow:
         else:
             over_agent = False
         color = self.BLACK if not over_agent else self.WHITE
-        # Dibuja el texto
-        text_surface = self.font.render(text, True, color)
+        # Obtiene el texto ya dibujado del atlas (o lo dibuja, si es algo nuevo)
+        text_surface = self.glyphs.get((text, color))
+        if text_surface is None:
+            text_surface = self.glyphs[text, color] = self.font.render(text, True, color)
 
+        screen_x, screen_y = self.window_to_screen_coords(window_x, window_y)
         text_rect = text_surface.get_rect()
-        text_rect.center = (window_x * self.RECTANGLE_WIDTH + self.RECTANGLE_WIDTH // 2,
-                            window_y * self.RECTANGLE_HEIGHT + self.RECTANGLE_HEIGHT // 2)
+        text_rect.center = (screen_x + self.RECTANGLE_WIDTH // 2,
+                            screen_y + self.RECTANGLE_HEIGHT // 2)
 
         # Pone el texto en la pantalla
         self.screen.blit(text_surface, text_rect)
 
+    def build_minimap(self):
+        """Genera el minimapa con lo que sabe el agente
+
+        Se dibuja sobre una superficie de un píxel por cuarto, que luego se escala una
+        sola vez, así que copiarla a la pantalla cuesta lo mismo sin importar el tamaño
+        del mundo. Solo tiene sentido cuando el mundo no cabe completo en la ventana.
+        """
+        if self.GRID_COLS <= self.VIEW_COLS and self.GRID_ROWS <= self.VIEW_ROWS:
+            self.minimap = None
+            return
+
+        # Agrega solo los movimientos nuevos desde la última vez
+        visited = self.agent.visited
+        self.visited_rooms.update(visited[self.visited_count:])
+        self.visited_count = len(visited)
+
+        pixels = pygame.Surface((self.GRID_COLS, self.GRID_ROWS))
+        # Lo desconocido queda en gris oscuro, lo visitado en blanco
+        pixels.fill(self.DARK_GRAY)
+        for room in self.visited_rooms:
+            pixels.set_at(self.grid_to_window_coords(*room), self.WHITE)
+        # Percepciones en amarillo, sospechas en rojo
+        for room, perception in self.perceptions.items():
+            color = self.RED if "?" in perception else self.YELLOW
+            pixels.set_at(self.grid_to_window_coords(*room), color)
+        pixels.set_at((self.agent_x, self.agent_y), self.BLACK)
+
+        # Escala el minimapa para que quepa en el cuadro inferior, manteniendo la proporción
+        longest = max(self.GRID_COLS, self.GRID_ROWS)
+        self.minimap = pygame.transform.scale(
+            pixels, (max(1, self.GRID_COLS * 90 // longest), max(1, self.GRID_ROWS * 90 // longest)))
+
     def run(self):
         # Main loop
         # Ahora sí está corriendo
@@ -179,31 +329,38 @@ class WorldWindow:
             # se reciben.
             self.handle_events()
 
-            # "Limpia" la pantalla (la rellena de blanco)
-            self.screen.fill(self.WHITE)
-
-            self.draw_grid()
+            # Obtiene la posición actual del agente en coordenadas del ambiente
+            current_pos = self.window_coords_to_grid(self.agent_x, self.agent_y)
+            # Mueve al agente en su ambiente solo si cambió de casilla: así la base de
+            # conocimiento se actualiza una vez por movimiento y no en cada cuadro
+            if current_pos != self.last_pos:
+                self.last_pos = current_pos
+                self.agent.move(current_pos,
+                                self.environment)
+                # Si tiene el oro y volvió al origen, el agente escapó
+                if current_pos == self.ORIGIN and self.agent.has_gold():
+                    self.escaped = True
+                self.perceptions = dict(self.agent.get_perceptions())
+                self.update_camera()
+                self.build_minimap()
+
+            # "Limpia" la pantalla copiando el fondo con la grilla ya dibujada
+            self.screen.blit(self.background, (0, 0))
 
             # Dibuja el agente
             pygame.draw.rect(self.screen, self.BLACK,
-                             (self.agent_x * self.RECTANGLE_WIDTH,
-                              self.agent_y * self.RECTANGLE_HEIGHT,
+                             (*self.window_to_screen_coords(self.agent_x, self.agent_y),
                               self.RECTANGLE_WIDTH,
                               self.RECTANGLE_HEIGHT))
 
-            # Obtiene la posición actual del agente en coordenadas del ambiente
-            current_pos = self.window_coords_to_grid(self.agent_x, self.agent_y)
-            # Mueve al agente en su ambiente
-            self.agent.move(current_pos,
-                            self.environment)
-            # Si tiene el oro y volvió al origen, el agente escapó
-            if current_pos == self.ORIGIN and self.agent.has_gold():
-                self.escaped = True
-
-            # Añade a los cuartos visitados lo que ha percibido y lo que deduce, según la base
-            # de conocimiento que tiene
-            for room, perception in self.agent.get_perceptions():
-                self.add_text_to_cell(*room, perception)
+            # Añade a los cuartos visibles lo que ha percibido y lo que deduce, según la base
+            # de conocimiento que tiene (si las casillas son lo bastante grandes)
+            if self.show_labels:
+                for col in range(self.camera_x, self.camera_x + self.VIEW_COLS):
+                    for row in range(self.camera_y, self.camera_y + self.VIEW_ROWS):
+                        room = self.window_coords_to_grid(col, row)
+                        if room in self.perceptions:
+                            self.add_text_to_cell(*room, self.perceptions[room])
 
             # Actualiza el mensaje informativo
             if self.agent.alive and not self.escaped:
@@ -222,8 +379,15 @@ class WorldWindow:
                     self.draw_text_frame("El agente ha caído al vacío, perdiéndose"
                                          " para siempre")
 
+            # El minimapa va en la esquina inferior derecha
+            if self.minimap is not None:
+                self.screen.blit(self.minimap,
+                                 (self.WINDOW_WIDTH - self.minimap.get_width() - 5,
+                                  self.WINDOW_HEIGHT - self.minimap.get_height() - 5))
+
             # Actualiza la ventana
             pygame.display.flip()
+            self.clock.tick(self.FPS)
 
         # Al finalizar de correr, cierra la ventana
         pygame.quit()
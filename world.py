@@ -1,11 +1,13 @@
 import utils
 
+import random
+
 
 class WumpusWorld:
     """Clase para representar al mundo del Wumpus, básicamente su cueva"""
-    def __init__(self) -> None:
-        self.__size = (4, 4)
-        self.__rooms = utils.generate_moves_between_cells()
+    def __init__(self, width: int = 4, height: int = 4) -> None:
+        self.__size = (width, height)
+        self.__rooms = utils.generate_moves_between_cells(width, height)
         # print(*[f"{k}: {v}" for k, v in self.__rooms.items()], sep='\n')
         # Elementos del mapa
         self.__pits = []
@@ -35,27 +37,50 @@ class WumpusWorld:
         self.__gold = (2, 3)
         self.__monster = (1, 3)
 
+    def populate_random(self, rng: random.Random, pit_probability: float = 0.2):
+        """Puebla el mundo aleatoriamente
+
+        Cada cuarto, salvo el de partida, tiene un pozo con probabilidad `pit_probability`.
+        El wumpus queda en cualquier cuarto distinto al de partida, y el oro en uno que no
+        tenga pozo ni wumpus (si es que queda alguno).
+
+        Parámetros
+        ----------
+        rng: random.Random
+            Generador de números aleatorios, para poder reproducir el mundo con una semilla
+        pit_probability: float
+            Probabilidad de que un cuarto tenga un pozo (default: 0.2)
+        """
+        start = self.__explorer
+        rooms = [room for room in self.__rooms if room != start]
+        self.__pits = [room for room in rooms if rng.random() < pit_probability]
+        self.__monster = rng.choice(rooms) if rooms else ()
+        taken = set(self.__pits)
+        taken.add(self.__monster)
+        free = [room for room in rooms if room not in taken]
+        self.__gold = rng.choice(free) if free else ()
+
     def set_explorer(self, location: tuple[int, int]):
         """Ubica al explorador (agente) en el mapa"""
         self.__explorer = location
 
     def __str__(self) -> str:
+        pits = set(self.__pits)
         world = []
         for row in range(self.height, 0, -1):
-            line = "|"
+            line = []
             for col in range(1, self.width + 1):
                 if self.__explorer == (col, row):
-                    line += " E "
+                    line.append(" E ")
                 elif self.__gold == (col, row):
-                    line += " G "
+                    line.append(" G ")
                 elif self.__monster == (col, row):
-                    line += " W "
-                elif (col, row) in self.__pits:
-                    line += " P "
+                    line.append(" W ")
+                elif (col, row) in pits:
+                    line.append(" P ")
                 else:
-                    line += "   "
-                line += "|"
-            world.append(line)
+                    line.append("   ")
+            world.append("|" + "|".join(line) + "|")
         return "\n".join(world)
 
     # Consultas acerca del mundo
@@ -0,0 +1,282 @@
+"""Mundo de Wumpus: punto de entrada
+
+Subcomandos:
+
+    python wumpus.py play [--gui]           juega moviendo al agente con WASD
+    python wumpus.py auto [--watch]         el agente juega solo, según su base de conocimiento
+    python wumpus.py replay --moves ddwa    repite una secuencia de movimientos (WASD)
+    python wumpus.py bench --episodes 100   mide resultados y tiempos de muchas partidas
+
+Pygame solo se importa al pedir la interfaz gráfica (`play --gui`), así que el resto
+funciona sin pantalla.
+"""
+import agent
+import utils
+import world
+
+import argparse
+import collections
+import random
+import sys
+import time
+
+# Resultados posibles de una partida automática
+ESCAPED = "escapó con el oro"
+DEAD = "murió"
+RETREAT = "se retiró sin el oro"
+TIMEOUT = "se quedó sin movimientos"
+
+
+def wasd_moves(text: str) -> str:
+    """Tipo para argparse: una secuencia de movimientos WASD"""
+    moves = text.lower()
+    invalid = sorted(set(moves) - set("wasd"))
+    if invalid:
+        raise argparse.ArgumentTypeError(f"movimientos inválidos: {', '.join(invalid)}")
+    return moves
+
+
+def make_world(size: int, seed: int = None) -> world.WumpusWorld:
+    """Crea el mundo del juego
+
+    Sin semilla y con el tamaño por defecto, usa el ejemplo fijo de `WumpusWorld.populate`;
+    en otro caso, lo puebla aleatoriamente.
+    """
+    w = world.WumpusWorld(size, size)
+    if seed is None and size == 4:
+        w.populate()
+    else:
+        w.populate_random(random.Random(seed))
+    return w
+
+
+def next_step(position: tuple[int, int], goals: set, safe: set, rooms: dict):
+    """Busca el primer paso del camino más corto hacia alguna meta, pasando solo por
+    cuartos seguros (búsqueda en anchura)
+
+    Retorna
+    -------
+    tuple or None:
+        Cuarto al que moverse, o `None` si no hay camino (o ya está en una meta)
+    """
+    if position in goals:
+        return None
+    first_steps = {position: None}
+    queue = collections.deque([position])
+    while queue:
+        room = queue.popleft()
+        for neighbor in rooms[room]:
+            if neighbor in first_steps or neighbor not in safe:
+                continue
+            first_steps[neighbor] = first_steps[room] or neighbor
+            if neighbor in goals:
+                return first_steps[neighbor]
+            queue.append(neighbor)
+    return None
+
+
+def auto_play(w: world.WumpusWorld, player: agent.Agent, max_steps: int = 1000,
+              on_move=None) -> tuple[str, int]:
+    """Juega una partida con una política fija basada en `Agent.ask_suggestions`
+
+    Un vecino se considera seguro si la base de conocimiento no sospecha que tenga un pozo
+    ni al wumpus. El agente explora los cuartos seguros, yendo siempre al más cercano que
+    no haya visitado. Al encontrar el oro, o si ya no quedan cuartos seguros por explorar,
+    vuelve al origen por cuartos seguros.
+
+    Si se entrega `on_move`, se llama con la cantidad de movimientos hechos al comenzar y
+    después de cada movimiento.
+
+    Retorna
+    -------
+    tuple[str, int]:
+        Resultado de la partida y cantidad de movimientos hechos
+    """
+    origin = player.current_position
+    player.perceive(w)
+    safe = {origin}
+    steps = 0
+    if on_move is not None:
+        on_move(steps)
+    while player.alive and not player.climb() and steps < max_steps:
+        safe.add(player.current_position)
+        _, possible_pits, possible_wumpus = player.ask_suggestions()
+        safe.update(room for room in w.rooms[player.current_position]
+                    if room not in possible_pits and room not in possible_wumpus)
+
+        if player.has_gold():
+            goals = {origin}
+        else:
+            goals = safe.difference(player.visited) or {origin}
+        if goals == {origin} and player.current_position == origin:
+            # No queda nada seguro por explorar
+            return RETREAT, steps
+
+        room = next_step(player.current_position, goals, safe, w.rooms)
+        if room is None:
+            return RETREAT, steps
+        player.move(room, w)
+        steps += 1
+        if on_move is not None:
+            on_move(steps)
+
+    if player.dead:
+        return DEAD, steps
+    if player.climb():
+        return ESCAPED, steps
+    return TIMEOUT, steps
+
+
+def play(args):
+    w = make_world(args.size, args.seed)
+    player = agent.Agent(w.width, w.height)
+    if args.gui:
+        # Solo aquí se necesita pygame
+        import window
+        window.WorldWindow(w, player).run()
+    else:
+        print(w)
+        try:
+            agent.play(w, player)
+        except (EOFError, KeyboardInterrupt):
+            # Se cerró la entrada (Ctrl+D o Ctrl+C): termina sin mostrar el error
+            print()
+
+
+def watch(w: world.WumpusWorld, player: agent.Agent, delay: float):
+    """Crea una función que dibuja el juego en la terminal después de cada movimiento"""
+    # Solo se importa si se pide, igual que pygame
+    import terminal
+    renderer = terminal.TerminalRenderer(w, player)
+
+    def on_move(steps: int):
+        renderer.render(f"Movimiento {steps}: agente en {player.current_position}."
+                        f" {player.move_suggestions()}")
+        time.sleep(delay)
+
+    return renderer, on_move
+
+
+def auto(args):
+    w = make_world(args.size, args.seed)
+    player = agent.Agent(w.width, w.height)
+    if args.watch:
+        renderer, on_move = watch(w, player, args.delay)
+        try:
+            result, steps = auto_play(w, player, args.max_steps, on_move)
+        finally:
+            renderer.close()
+    else:
+        print(w)
+
+        def on_move(steps: int):
+            print(f"{steps}: {player.current_position}. {player.move_suggestions()}")
+
+        result, steps = auto_play(w, player, args.max_steps, on_move)
+    print(f"El agente {result} después de {steps} movimientos.")
+
+
+def replay(args):
+    w = make_world(args.size, args.seed)
+    player = agent.Agent(w.width, w.height)
+    renderer, on_move = watch(w, player, args.delay)
+    steps = 0
+    try:
+        player.perceive(w)
+        on_move(steps)
+        for move in args.moves:
+            if player.dead or player.climb():
+                break
+            # Igual que en `agent.play`, los movimientos contra un borde no hacen nada
+            x, y = player.current_position
+            match move:
+                case 'w':
+                    y += 1 if w.height > y else 0
+                case 's':
+                    y -= 1 if y > 1 else 0
+                case 'a':
+                    x -= 1 if x > 1 else 0
+                case 'd':
+                    x += 1 if w.width > x else 0
+            player.move((x, y), w)
+            steps += 1
+            on_move(steps)
+    finally:
+        renderer.close()
+
+    if player.dead:
+        result = DEAD
+    elif player.climb():
+        result = ESCAPED
+    else:
+        result = TIMEOUT
+    print(f"El agente {result} después de {steps} movimientos.")
+
+
+def bench(args):
+    rng = random.Random(args.seed)
+    results = collections.Counter()
+    total_steps = 0
+    start = time.perf_counter()
+    for _ in range(args.episodes):
+        w = make_world(args.size, rng.randrange(2**32))
+        result, steps = auto_play(w, agent.Agent(w.width, w.height), args.max_steps)
+        results[result] += 1
+        total_steps += steps
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.episodes} partidas en mundos de {args.size}x{args.size}"
+          f" (semilla {args.seed}), {elapsed:.2f} s")
+    for result in (ESCAPED, DEAD, RETREAT, TIMEOUT):
+        print(f"  {result}: {results[result]} ({results[result] / args.episodes:.1%})")
+    print(f"  movimientos promedio: {total_steps / args.episodes:.1f}")
+    print(f"  {args.episodes / elapsed:.1f} partidas por segundo,"
+          f" {elapsed / max(total_steps, 1) * 1000:.3f} ms por movimiento")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(prog="wumpus", description=__doc__.splitlines()[0])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    play_parser = subparsers.add_parser("play", help="juega moviendo al agente con WASD")
+    play_parser.add_argument("--gui", action="store_true", help="usa la ventana de pygame")
+    play_parser.set_defaults(func=play)
+
+    auto_parser = subparsers.add_parser("auto", help="el agente juega solo")
+    auto_parser.add_argument("--watch", action="store_true",
+                             help="muestra el juego en la terminal mientras avanza")
+    auto_parser.set_defaults(func=auto)
+
+    replay_parser = subparsers.add_parser("replay", help="repite una secuencia de movimientos")
+    replay_parser.add_argument("--moves", required=True, type=wasd_moves,
+                               help="movimientos, como letras WASD (por ejemplo, ddwwa)")
+    replay_parser.set_defaults(func=replay)
+
+    bench_parser = subparsers.add_parser("bench", help="juega muchas partidas y mide")
+    bench_parser.add_argument("--episodes", type=utils.positive_int, default=100,
+                              help="cantidad de partidas (default: 100)")
+    bench_parser.set_defaults(func=bench)
+
+    for subparser in (play_parser, auto_parser, replay_parser, bench_parser):
+        subparser.add_argument("--size", type=utils.positive_int, default=4,
+                               help="ancho y alto del mundo (default: 4)")
+    for subparser in (play_parser, auto_parser, replay_parser):
+        subparser.add_argument("--seed", type=int, default=None,
+                               help="semilla para generar el mundo (default: el ejemplo fijo"
+                                    " si el tamaño es 4, uno aleatorio si no)")
+    bench_parser.add_argument("--seed", type=int, default=0,
+                              help="semilla para generar los mundos (default: 0)")
+    for subparser in (auto_parser, bench_parser):
+        subparser.add_argument("--max-steps", type=utils.positive_int, default=1000,
+                               help="movimientos máximos por partida (default: 1000)")
+    for subparser in (auto_parser, replay_parser):
+        subparser.add_argument("--delay", type=utils.non_negative_float, default=0.2,
+                               help="segundos de espera entre movimientos al mirar el juego"
+                                    " en la terminal (default: 0.2)")
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())